@@ -40,10 +40,12 @@ class Settings(BaseSettings):
     voyage_api_key: str = ""
     voyage_model: str = "voyage-law-2"
     hf_embedding_model: str = "sentence-transformers/all-MiniLM-L6-v2"
+    embedding_batch_size: int = 64       # chunks per embed/upsert call (Voyage caps at 128)
 
     # ── Chunking ─────────────────────────────────────────────────────
     chunk_size_words: int = 400          # target ~300-500 words per chunk
     chunk_overlap_words: int = 50        # overlap for context continuity
+    ingest_max_workers: int = 1          # processes for run_ingest (0 = one per CPU)
 
     # ── Retrieval ────────────────────────────────────────────────────
     retrieval_top_k: int = 5             # top-k chunks returned per query
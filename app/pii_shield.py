@@ -263,8 +263,17 @@ _LOG_SCRUB_PATTERNS: list[tuple[re.Pattern, str]] = [
 ]
 
 
+# Every scrub pattern needs at least one of these to match: three digits
+# in a row (SSN, VA file, DOB year, phone), "@" (email), or a JWT/Fernet
+# prefix.  The filter runs on every log record and most messages contain
+# none of them, so one scan lets those skip all the patterns above.
+_LOG_SCRUB_TRIGGER = re.compile(r"\d{3}|@|eyJ|gAAAAA")
+
+
 def scrub_pii_from_string(text: str) -> str:
     """Remove all PII patterns from a string before logging."""
+    if not _LOG_SCRUB_TRIGGER.search(text):
+        return text
     for pattern, replacement in _LOG_SCRUB_PATTERNS:
         text = pattern.sub(replacement, text)
     return text
@@ -389,6 +389,7 @@ async def evaluate(
 
 ALLOWED_UPLOAD_EXTENSIONS = {".txt", ".md", ".pdf"}
 MAX_UPLOAD_BYTES = settings.max_upload_size_mb * 1024 * 1024
+UPLOAD_READ_CHUNK_BYTES = 1024 * 1024
 
 
 @app.post("/upload", response_model=UploadResponse)
@@ -416,18 +417,36 @@ async def upload_document(
             detail=f"Unsupported file type '{ext}'. Accepted: .txt, .md",
         )
 
-    # Read and validate size
-    content = await file.read()
-    if len(content) > MAX_UPLOAD_BYTES:
+    # Validate size.  Starlette's multipart parser has already received
+    # and spooled the whole body before this handler runs, so reject on
+    # the recorded size before anything is written to UPLOADS_DIR.
+    if file.size is not None and file.size > MAX_UPLOAD_BYTES:
         raise HTTPException(
             status_code=413,
             detail=f"File exceeds {settings.max_upload_size_mb} MB limit.",
         )
 
-    # Save with a unique filename to prevent collisions
+    # Save with a unique filename to prevent collisions.  The spooled body
+    # is copied in fixed-size pieces rather than read in one go, so memory
+    # stays flat however large the upload is.  The running total enforces
+    # the limit when the size was not recorded, and a partial file is
+    # removed if the copy fails for any reason.
     safe_name = f"{uuid.uuid4().hex[:8]}_{file.filename}"
     upload_path = UPLOADS_DIR / safe_name
-    upload_path.write_bytes(content)
+    written = 0
+    try:
+        with upload_path.open("wb") as out:
+            while piece := await file.read(UPLOAD_READ_CHUNK_BYTES):
+                written += len(piece)
+                if written > MAX_UPLOAD_BYTES:
+                    raise HTTPException(
+                        status_code=413,
+                        detail=f"File exceeds {settings.max_upload_size_mb} MB limit.",
+                    )
+                out.write(piece)
+    except BaseException:
+        upload_path.unlink(missing_ok=True)
+        raise
 
     # Ingest the uploaded file into the vector store
     try:
@@ -467,14 +486,19 @@ async def stats():
 
 
 @app.post("/ingest", response_model=IngestResponse)
-async def ingest():
+async def ingest(reembed: bool = False):
     """
     Admin endpoint: re-ingest all documents from data/raw/ into the
     vector store. Useful after adding new legal texts.
+
+    Chunks already stored with identical metadata are skipped; pass
+    ``?reembed=true`` to re-embed everything (e.g. after switching the
+    embedding model).
     """
     _require_initialized()
-    chunks = ingest_directory()
-    count = rag_chain._store.add_chunks(chunks)
+    # Always in-process: never fork the server (model + Chroma threads).
+    chunks = ingest_directory(max_workers=1)
+    count = rag_chain._store.add_chunks(chunks, skip_existing=not reembed)
     return IngestResponse(
         status="success",
         chunks_ingested=count,
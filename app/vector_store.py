@@ -13,6 +13,7 @@ retrieval by source_type at query time.
 from __future__ import annotations
 
 import logging
+from concurrent.futures import Future, ThreadPoolExecutor
 from typing import Protocol
 
 import chromadb
@@ -95,33 +96,97 @@ class VectorStore:
 
     # ── Write ────────────────────────────────────────────────────────
 
-    def add_chunks(self, chunks: list[Chunk], batch_size: int = 64) -> int:
+    def add_chunks(
+        self,
+        chunks: list[Chunk],
+        batch_size: int = settings.embedding_batch_size,
+        skip_existing: bool = True,
+    ) -> int:
         """
         Embed and upsert a list of Chunk objects into ChromaDB.
+
+        Chunk IDs are content hashes, so with *skip_existing* a chunk is
+        left as-is rather than re-embedded when the collection already
+        holds its ID *and* identical metadata — re-running ingest over an
+        unchanged corpus only embeds what is new, while an edited,
+        re-tagged or re-uploaded document still has its chunk metadata
+        (chunk_index, total_chunks, source_file, …) refreshed.  The skip
+        cannot tell which model produced a stored vector, so pass
+        ``skip_existing=False`` to re-embed everything after changing the
+        embedding model.
+
+        Embedding and storage are pipelined: each batch is upserted on a
+        background thread while the next batch is being embedded.  At most
+        one upsert is in flight, so batches land in order and an upsert
+        error surfaces here before any later batch is written.
+
         Returns the number of chunks stored.
         """
         if not chunks:
             return 0
 
-        total_added = 0
-        for i in range(0, len(chunks), batch_size):
-            batch = chunks[i : i + batch_size]
-            texts = [c.text for c in batch]
-            ids = [c.chunk_id for c in batch]
-            metas = [c.metadata for c in batch]
-
-            embeddings = self._embedder.embed(texts)
-
-            self._collection.upsert(
-                ids=ids,
-                embeddings=embeddings,
-                documents=texts,
-                metadatas=metas,
+        # Identical text (shared boilerplate, the same section in two
+        # files) yields identical content-hash IDs.  Keep the first copy
+        # so it is embedded once — ChromaDB also rejects duplicate IDs
+        # within a single upsert.
+        unique: dict[str, Chunk] = {}
+        for chunk in chunks:
+            unique.setdefault(chunk.chunk_id, chunk)
+        if len(unique) < len(chunks):
+            logger.info(
+                "Skipping %d duplicate chunks", len(chunks) - len(unique)
             )
-            total_added += len(batch)
-            logger.info("  upserted batch %d–%d", i, i + len(batch))
+            chunks = list(unique.values())
 
-        logger.info("Total documents in collection: %d", self._collection.count())
+        total_added = 0
+        pending: Future | None = None
+        with ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="chroma-upsert"
+        ) as writer:
+            try:
+                for i in range(0, len(chunks), batch_size):
+                    batch = chunks[i : i + batch_size]
+                    if skip_existing:
+                        existing = self._collection.get(
+                            ids=[c.chunk_id for c in batch], include=["metadatas"]
+                        )
+                        stored = dict(zip(existing["ids"], existing["metadatas"]))
+                        batch = [
+                            c for c in batch
+                            if stored.get(c.chunk_id) != c.metadata
+                        ]
+                        if not batch:
+                            continue
+                    texts = [c.text for c in batch]
+                    ids = [c.chunk_id for c in batch]
+                    metas = [c.metadata for c in batch]
+
+                    embeddings = self._embedder.embed(texts)
+
+                    if pending is not None:
+                        pending.result()
+                    pending = writer.submit(
+                        self._collection.upsert,
+                        ids=ids,
+                        embeddings=embeddings,
+                        documents=texts,
+                        metadatas=metas,
+                    )
+                    total_added += len(batch)
+                    logger.info(
+                        "  embedded %d chunks from %d–%d (upsert queued)",
+                        len(batch), i, min(i + batch_size, len(chunks)),
+                    )
+            finally:
+                # Also reached when embed() raises, so a failed in-flight
+                # upsert is never silently dropped.
+                if pending is not None:
+                    pending.result()
+
+        logger.info(
+            "Stored %d chunks (total documents in collection: %d)",
+            total_added, self._collection.count(),
+        )
         return total_added
 
     # ── Read ─────────────────────────────────────────────────────────
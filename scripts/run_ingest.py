@@ -6,8 +6,14 @@ Run this script to ingest all documents from app/data/raw/ into ChromaDB.
 Execute from the project root:
 
     python -m scripts.run_ingest
+
+Chunks already stored with identical metadata are skipped.  Pass
+--reembed to re-embed every chunk, e.g. after changing the embedding
+model.  Pass --workers N to clean and chunk files in N processes
+(0 = one per CPU) — worthwhile only for a large corpus.
 """
 
+import argparse
 import logging
 import sys
 from pathlib import Path
@@ -15,6 +21,7 @@ from pathlib import Path
 # Ensure project root is on sys.path
 sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
 
+from app.config import settings
 from app.ingest import ingest_directory
 from app.vector_store import VectorStore
 
@@ -26,17 +33,31 @@ logger = logging.getLogger(__name__)
 
 
 def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0].strip())
+    parser.add_argument(
+        "--reembed",
+        action="store_true",
+        help="re-embed and overwrite chunks that are already stored",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=settings.ingest_max_workers,
+        help="processes for cleaning/chunking (0 = one per CPU, default: %(default)s)",
+    )
+    args = parser.parse_args()
+
     logger.info("=== Valor Assist — Document Ingestion ===")
 
     # 1. Ingest & chunk all raw documents
-    chunks = ingest_directory()
+    chunks = ingest_directory(max_workers=args.workers)
     if not chunks:
         logger.error("No chunks produced. Add .txt or .md files to app/data/raw/")
         sys.exit(1)
 
     # 2. Embed & store in ChromaDB
     store = VectorStore()
-    added = store.add_chunks(chunks)
+    added = store.add_chunks(chunks, skip_existing=not args.reembed)
     logger.info("Done — %d chunks stored in ChromaDB.", added)
 
     # 3. Quick sanity check: run a sample query